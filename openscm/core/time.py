@@ -8,9 +8,8 @@ dedicated `Jupyter Notebook
 <https://github.com/openclimatedata/openscm/blob/master/notebooks/timeseries.ipynb>`_.
 """
 
-import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, Sequence, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
@@ -94,16 +93,14 @@ class InterpolationType(Enum):
 def _float_year_to_datetime(inp: float) -> np.datetime64:
     year = int(inp)
     fractional_part = inp - year
-    return np.datetime64(  # pylint: disable=too-many-function-args
+    year_start = np.datetime64(  # pylint: disable=too-many-function-args
         year - 1970, "Y"
-    ) + np.timedelta64(  # pylint: disable=too-many-function-args
-        int(
-            (
-                datetime.datetime(year + 1, 1, 1) - datetime.datetime(year, 1, 1)
-            ).total_seconds()
-            * fractional_part
-        ),
-        "s",
+    )
+    year_length = (year_start + 1).astype("datetime64[s]") - year_start.astype(
+        "datetime64[s]"
+    )
+    return year_start + np.timedelta64(  # pylint: disable=too-many-function-args
+        int(year_length.astype(float) * fractional_part), "s"
     )
 
 
@@ -201,7 +198,7 @@ class TimePoints:  # TODO: track type of timeseries
         :obj:`np.array` of :obj:`int`
             Year of each time point
         """
-        return np.vectorize(getattr)(self._values.astype(object), "year")
+        return self._values.astype("datetime64[Y]").astype(int) + 1970
 
     def months(self) -> np.ndarray:
         """
@@ -212,7 +209,9 @@ class TimePoints:  # TODO: track type of timeseries
         :obj:`np.array` of :obj:`int`
             Month of each time point
         """
-        return np.vectorize(getattr)(self._values.astype(object), "month")
+        return (
+            self._values.astype("datetime64[M]") - self._values.astype("datetime64[Y]")
+        ).astype(int) + 1
 
     def days(self) -> np.ndarray:
         """
@@ -223,7 +222,9 @@ class TimePoints:  # TODO: track type of timeseries
         :obj:`np.array` of :obj:`int`
             Day of each time point
         """
-        return np.vectorize(getattr)(self._values.astype(object), "day")
+        return (
+            self._values.astype("datetime64[D]") - self._values.astype("datetime64[M]")
+        ).astype(int) + 1
 
     def hours(self) -> np.ndarray:
         """
@@ -234,7 +235,9 @@ class TimePoints:  # TODO: track type of timeseries
         :obj:`np.array` of :obj:`int`
             Hour of each time point
         """
-        return np.vectorize(getattr)(self._values.astype(object), "hour")
+        return (
+            self._values.astype("datetime64[h]") - self._values.astype("datetime64[D]")
+        ).astype(int)
 
     def weekdays(self) -> np.ndarray:
         """
@@ -245,7 +248,8 @@ class TimePoints:  # TODO: track type of timeseries
         :obj:`np.array` of :obj:`int`
             Day of the week of each time point
         """
-        return np.vectorize(datetime.datetime.weekday)(self._values.astype(object))
+        # 1970-01-01 was a Thursday (weekday 3)
+        return (self._values.astype("datetime64[D]").astype(int) + 3) % 7
 
 
 def create_time_points(  # TODO: replace by simpler function
@@ -279,17 +283,15 @@ def create_time_points(  # TODO: replace by simpler function
         if timeseries_type == ParameterType.AVERAGE_TIMESERIES
         else points_num
     )
-    end_time_output = start_time + (points_num_output - 1) * period_length
-    return np.linspace(
-        start_time.astype("datetime64[s]").astype(float),
-        end_time_output.astype("datetime64[s]").astype(float),
-        points_num_output,
-        dtype="datetime64[s]",
+    return (start_time + np.arange(points_num_output) * period_length).astype(
+        "datetime64[s]"
     )
 
 
 def _calc_interval_averages(
-    continuous_representation: Callable[[float], float], target_intervals: np.ndarray
+    continuous_representation: Callable[[float], float],
+    target_intervals: np.ndarray,
+    knots: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Calculate the interval averages of a continuous function.
@@ -305,21 +307,38 @@ def _calc_interval_averages(
         :func:`openscm.timeseries_converter.TimeseriesConverter._calc_continuous_representation`.
     target_intervals
         Intervals to calculate the average of.
+    knots
+        If not ``None``, :obj:`continuous_representation` is linear between these
+        points (and beyond the outermost ones) so the integrals are calculated exactly
+        rather than by numerical integration.
 
     Returns
     -------
     np.ndarray
         Array of the interval/period averages
     """
+    if knots is not None:
+        # the function is linear between all knots and interval bounds so the midpoint
+        # rule over these points is exact (unlike the trapezoidal rule, it also copes
+        # with jumps at the outermost knots e.g. for constant extrapolation)
+        x = np.union1d(knots, target_intervals)
+        x = x[(x >= target_intervals[0]) & (x <= target_intervals[-1])]
+        segment_lengths = np.diff(x)
+        y = continuous_representation(x[:-1] + segment_lengths / 2)
+        cumulative_integral = np.concatenate(([0], np.cumsum(y * segment_lengths)))
+        return np.diff(
+            cumulative_integral[np.searchsorted(x, target_intervals)]
+        ) / np.diff(target_intervals)
+
     # TODO: numerical integration here could be very expensive
     # TODO: update to include caching and/or analytic solutions depending on interpolation choice
-    int_averages = [np.nan] * len(target_intervals[:-1])
+    int_averages = np.full(len(target_intervals) - 1, np.nan)
     for i, l in enumerate(target_intervals[:-1]):
         u = target_intervals[i + 1]
         y, _ = integrate.quad(continuous_representation, l, u)
         int_averages[i] = y / (u - l)
 
-    return np.array(int_averages)
+    return int_averages
 
 
 def _calc_integral_preserving_linear_interpolation(values: np.ndarray) -> np.ndarray:
@@ -580,11 +599,18 @@ class TimeseriesConverter:
             Converted time period average data for timeseries :obj:`values`
         """
         if self._timeseries_type == ParameterType.AVERAGE_TIMESERIES:
+            continuous_representation = self._calc_continuous_representation(
+                source_time_points.astype(_TARGET_TYPE), values
+            )
+            # a linear interpolation is piecewise linear between the points it
+            # interpolates so can be integrated exactly
+            knots = None
+            if self._interpolation_type == InterpolationType.LINEAR:
+                knots = continuous_representation.x  # type: ignore
             return _calc_interval_averages(
-                self._calc_continuous_representation(
-                    source_time_points.astype(_TARGET_TYPE), values
-                ),
+                continuous_representation,
                 target_time_points.astype(_TARGET_TYPE),
+                knots=knots,
             )
         if self._timeseries_type == ParameterType.POINT_TIMESERIES:
             return self._calc_continuous_representation(
@@ -15,7 +15,7 @@ units are used internally, we provide the following example:
 
 .. code:: python
 
-    >>> from openscm.units import _unit_registry
+    >>> from openscm.core.units import _unit_registry
     >>> _unit_registry("CO2")
     <Quantity(1, 'CO2')>
 
@@ -42,8 +42,9 @@ For emissions units, there are a few cases to be considered:
 - case-sensitivity. In order to provide a simplified interface, using all uppercase
   versions of any unit is also valid e.g. ``unit_registry("HFC4310mee")`` is the same as
   ``unit_registry("HFC4310MEE")``
-- hyphens and underscores in units. In order to be Pint compatible and to simplify
-  things, we strip all hyphens and underscores from units.
+- hyphens in gas names. In order to be Pint compatible and to simplify things, we strip
+  hyphens after gas families such as "HFC" from units e.g. ``UnitConverter("kt
+  HFC-134a", "t HFC134a")`` is valid.
 
 As a convenience, we allow users to combine the mass and the type of emissions to make a
 'joint unit' e.g. "tCO2" but it should be recognised that this joint unit is a derived
@@ -73,7 +74,7 @@ However, it can be performed within the context 'CH4_conversions' as shown below
 
 .. code:: python
 
-    >>> from openscm.units import UnitConverter
+    >>> from openscm.core.units import UnitConverter
     >>> uc = UnitConverter("CH4", "C")
     pint.errors.DimensionalityError: Cannot convert from 'CH4' ([methane]) to 'C' ([carbon])
 
@@ -95,7 +96,7 @@ prevent inadvertent conversions from 'NOx' to e.g. 'N2O', the conversion 'NOx' <
 
 .. code:: python
 
-    >>> from openscm.units import unit_registry
+    >>> from openscm.core.units import UnitConverter
     >>> uc = UnitConverter("NOx", "N")
     pint.errors.DimensionalityError: Cannot convert from 'NOx' ([NOx]) to 'N' ([nitrogen])
 
@@ -109,8 +110,12 @@ prevent inadvertent conversions from 'NOx' to e.g. 'N2O', the conversion 'NOx' <
     >>> uc.convert_from(1)
     0.9565217391304348
 """
+import functools
+import math
+import re
+import threading
 import warnings
-from typing import Dict, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pint
@@ -118,6 +123,7 @@ from pint.errors import (  # noqa: F401 # pylint: disable=unused-import
     DimensionalityError,
     UndefinedUnitError,
 )
+from pint.util import to_units_container
 
 # Standard gases. If the value is:
 # - str: this entry defines a base gas unit
@@ -242,6 +248,92 @@ _standard_gases = {
 }
 
 
+# Hyphens inside gas names (e.g. "HFC-134a"), which are stripped before conversion. Only
+# hyphens after the families of gases which are commonly written with a hyphen before
+# their number are matched as elsewhere they may be minus signs (e.g. "W m-2").
+_GAS_NAME_HYPHEN_RE = re.compile(r"(CFC|HCFC|HCFE|HFC|HFE|Halon)-(?=\d)", re.IGNORECASE)
+
+
+def _get_mass_emissions_joint_version(symbol: str) -> List[str]:
+    """
+    Get the definitions of units which are the combination of mass and emissions.
+
+    This allows users to units like e.g. ``"tC"`` rather than requiring a space
+    between the mass and the emissions i.e. ``"t C"``
+
+    Parameters
+    ----------
+    symbol
+        The unit to add a joint version for
+
+    Returns
+    -------
+    List[str]
+        Definitions of the joint units
+    """
+    return [
+        "g{symbol} = g * {symbol}".format(symbol=symbol),
+        "t{symbol} = t * {symbol}".format(symbol=symbol),
+    ]
+
+
+def _get_gas_definitions(
+    gases: Dict[str, Union[str, Sequence[str]]]
+) -> Dict[str, Tuple[str, ...]]:
+    """
+    Get the unit definitions for gases.
+
+    Parameters
+    ----------
+    gases
+        Gases to define, see :obj:`_standard_gases`
+
+    Returns
+    -------
+    Dict[str, Tuple[str, ...]]
+        Definitions (in Pint's definition syntax) for each gas symbol
+    """
+    gas_definitions = {}
+    for symbol, value in gases.items():
+        definitions = []
+        if isinstance(value, str):
+            # symbol is base unit
+            definitions.append("{} = [{}]".format(symbol, value))
+            if value != symbol:
+                definitions.append("{} = {}".format(value, symbol))
+        else:
+            # symbol has conversion and aliases
+            definitions.append("{} = {}".format(symbol, value[0]))
+            for alias in value[1:]:
+                definitions.append("{} = {}".format(alias, symbol))
+
+        definitions += _get_mass_emissions_joint_version(symbol)
+
+        # Add alias for upper case symbol:
+        if symbol.upper() != symbol:
+            definitions.append("{} = {}".format(symbol.upper(), symbol))
+            definitions += _get_mass_emissions_joint_version(symbol.upper())
+
+        gas_definitions[symbol] = tuple(definitions)
+
+    return gas_definitions
+
+
+_STANDARD_GAS_DEFINITIONS = _get_gas_definitions(_standard_gases)
+"""
+Unit definitions for the standard gases, built once and shared by all registries
+"""
+
+# Dimensionalities, in terms of a species' base dimension, for which metric conversions
+# to and from carbon are added to each metric context
+_METRIC_CONVERSION_DIMENSIONALITIES = (
+    "{}",
+    "[mass] * {} / [time]",
+    "[mass] * {}",
+    "{} / [time]",
+)
+
+
 class ScmUnitRegistry(pint.UnitRegistry):  # type: ignore
     """
     Unit registry class for OpenSCM. Provides some convenience methods to add standard
@@ -250,69 +342,136 @@ class ScmUnitRegistry(pint.UnitRegistry):  # type: ignore
 
     _contexts_loaded: bool = False
 
-    def add_standards(self):
+    _contexts_lock = threading.Lock()
+    """Lock ensuring contexts are only loaded once"""
+
+    _pending_definitions: Dict[str, Tuple[str, ...]]
+    """
+    Definitions which are only loaded once one of the names they define is used, keyed
+    by each of these names
+    """
+
+    _pending_definitions_lock = threading.RLock()
+    """
+    Lock ensuring pending definitions are only loaded once (re-entrant as definitions
+    may refer to other pending definitions)
+    """
+
+    def __init__(self, *args, **kwargs):
         """
-        Add standard units.
+        Initialize.
 
-        Has to be done separately because of pint's weird initializing.
+        All arguments are passed on to :class:`pint.UnitRegistry`.
         """
-        self._add_gases(_standard_gases)
+        self._pending_definitions = {}
+        super().__init__(*args, **kwargs)
 
-        self.define("a = 1 * year = annum = yr")
-        self.define("h = hour")
-        self.define("d = day")
-        self.define("degreeC = degC")
-        self.define("degreeF = degF")
-        self.define("kt = 1000 * t")  # since kt is used for "knot" in the defaults
+    def add_standards(self):
+        """
+        Add standard units.
 
-        self.define("ppt = [concentrations]")
-        self.define("ppb = 1000 * ppt")
-        self.define("ppm = 1000 * ppb")
+        Has to be done separately because of pint's weird initializing. Gas units are
+        only defined the first time one of their names is used (see
+        :meth:`parse_unit_name`).
+        """
+        definitions: List[str] = []
+        for gas_definitions in _STANDARD_GAS_DEFINITIONS.values():
+            names = [d.split("=")[0].strip() for d in gas_definitions]
+            # names pint already knows (e.g. "N" for newton) would never be looked up
+            # lazily so these have to be redefined straight away
+            if any(self._is_defined(name) for name in names):
+                definitions += gas_definitions
+            else:
+                for name in names:
+                    self._pending_definitions[name] = gas_definitions
+
+        definitions += [
+            "a = 1 * year = annum = yr",
+            "h = hour",
+            "d = day",
+            "degreeC = degC",
+            "degreeF = degF",
+            "kt = 1000 * t",  # since kt is used for "knot" in the defaults
+            "ppt = [concentrations]",
+            "ppb = 1000 * ppt",
+            "ppm = 1000 * ppb",
+        ]
+
+        # load all definitions in one go rather than calling ``define`` for each
+        self.load_definitions(definitions)
 
     def enable_contexts(self, *names_or_contexts, **kwargs):
         """
         Overload pint's :func:`enable_contexts` to load contexts once (the first time
         they are used) to avoid (unnecessary) file operations on import.
         """
-        if not self._contexts_loaded:
-            self._load_contexts()
-        self._contexts_loaded = True
+        with self._contexts_lock:
+            if not self._contexts_loaded:
+                self._load_contexts()
+                self._contexts_loaded = True
+                # no need to check again, go straight to pint from now on
+                self.enable_contexts = super().enable_contexts
         super().enable_contexts(*names_or_contexts, **kwargs)
 
-    def _add_mass_emissions_joint_version(self, symbol: str) -> None:
+    def parse_unit_name(self, unit_name, *args, **kwargs):
+        """
+        Overload pint's :func:`parse_unit_name` to define gas units the first time they
+        are used.
+
+        Pint resolves all unit names (e.g. in :func:`get_name` and :func:`get_symbol`)
+        through this method so pending definitions are loaded before pint decides that
+        a unit is undefined.
         """
-        Add a unit which is the combination of mass and emissions.
+        candidates = tuple(super().parse_unit_name(unit_name, *args, **kwargs))
+        if not candidates:
+            # always look up again as another thread may just have loaded the unit
+            self._load_pending_definitions(unit_name)
+            candidates = tuple(super().parse_unit_name(unit_name, *args, **kwargs))
 
-        This allows users to units like e.g. ``"tC"`` rather than requiring a space
-        between the mass and the emissions i.e. ``"t C"``
+        yield from candidates
+
+    def _is_defined(self, unit_name: str) -> bool:
+        """
+        Check whether a unit is defined without loading any pending definitions.
 
         Parameters
         ----------
-        symbol
-            The unit to add a joint version for
-        """
-        self.define("g{symbol} = g * {symbol}".format(symbol=symbol))
-        self.define("t{symbol} = t * {symbol}".format(symbol=symbol))
-
-    def _add_gases(self, gases: Dict[str, Union[str, Sequence[str]]]) -> None:
-        for symbol, value in gases.items():
-            if isinstance(value, str):
-                # symbol is base unit
-                self.define("{} = [{}]".format(symbol, value))
-                if value != symbol:
-                    self.define("{} = {}".format(value, symbol))
-            else:
-                # symbol has conversion and aliases
-                self.define("{} = {}".format(symbol, value[0]))
-                for alias in value[1:]:
-                    self.define("{} = {}".format(alias, symbol))
+        unit_name
+            Unit to check
 
-            self._add_mass_emissions_joint_version(symbol)
+        Returns
+        -------
+        bool
+            ``True`` if the unit is defined
+        """
+        return any(True for _ in super().parse_unit_name(unit_name))
 
-            # Add alias for upper case symbol:
-            if symbol.upper() != symbol:
-                self.define("{} = {}".format(symbol.upper(), symbol))
-                self._add_mass_emissions_joint_version(symbol.upper())
+    def _load_pending_definitions(self, unit_name: str) -> None:
+        """
+        Load the pending definitions which may be needed to parse a unit.
+
+        Parameters
+        ----------
+        unit_name
+            Unit which could not be found. As it may carry a prefix (e.g. ``"MtCO2"``),
+            all pending definitions whose names end the unit are loaded.
+        """
+        with self._pending_definitions_lock:
+            to_load: List[Tuple[str, ...]] = []
+            for name, definitions in self._pending_definitions.items():
+                if unit_name.endswith(name) and definitions not in to_load:
+                    to_load.append(definitions)
+
+            if not to_load:
+                return
+
+            self._pending_definitions = {
+                name: definitions
+                for name, definitions in self._pending_definitions.items()
+                if definitions not in to_load
+            }
+            for definitions in to_load:
+                self.load_definitions(definitions)
 
     def _load_contexts(self) -> None:
         """
@@ -359,94 +518,94 @@ class ScmUnitRegistry(pint.UnitRegistry):  # type: ignore
 
         This is done only when contexts are needed to avoid reading files on import.
         """
-        import pandas as pd
+        import csv
         from os import path
 
-        metric_conversions = pd.read_csv(
+        # the file is tiny so read it with :mod:`csv` rather than importing pandas
+        with open(
             path.join(
                 path.dirname(path.abspath(__file__)),
                 "..",
                 "data",
                 "metric_conversions.csv",
             ),
-            skiprows=1,  # skip source row
-            header=0,
-            index_col=0,
-        ).iloc[
-            1:, :
-        ]  # drop out 'OpenSCM base unit' row
+            newline="",
+        ) as csv_file:
+            reader = csv.reader(csv_file)
+            next(reader)  # skip source row
+            metrics = next(reader)[1:]
+            next(reader)  # skip 'OpenSCM species' row
+            metric_conversions = [
+                (row[0], [float(v) if v else np.nan for v in row[1:]])
+                for row in reader
+                if row
+            ]
 
         def _get_transform_func(ureg_unit, conversion_factor, forward=True):
+            # build the factor once rather than redoing the unit arithmetic on every
+            # conversion
+            factor = self.carbon / ureg_unit * conversion_factor
+
             if forward:
 
-                def result_forward(ur, strt):
-                    return strt * ur.carbon / ureg_unit * conversion_factor
+                def result_forward(ur, strt):  # pylint: disable=unused-argument
+                    return strt * factor
 
                 return result_forward
 
-            def result_backward(ur, strt):
-                return strt * ureg_unit / ur.carbon / conversion_factor
+            def result_backward(ur, strt):  # pylint: disable=unused-argument
+                return strt / factor
 
             return result_backward
 
-        for col in metric_conversions:
-            tc = pint.Context(col)
-            for label, val in metric_conversions[col].iteritems():
-                conv_val = (
-                    val
-                    * (self("CO2").to_base_units()).magnitude
-                    / (self(label).to_base_units()).magnitude
+        # the species' units do not depend on the metric so only look them up once
+        co2_magnitude = self("CO2").to_base_units().magnitude
+        label_info = {}
+        for label, _ in metric_conversions:
+            label_base = self(label).to_base_units()
+            base_unit = next(
+                iter(
+                    self._get_dimensionality(
+                        label_base._units  # pylint: disable=protected-access
+                    )
                 )
-                base_unit = [
-                    s
-                    for s, _ in self._get_dimensionality(
-                        self(label)  # pylint: disable=protected-access
-                        .to_base_units()
-                        ._units
-                    ).items()
-                ][0]
-
-                unit_reg_unit = getattr(
-                    self, base_unit.replace("[", "").replace("]", "")
-                )
-                tc.add_transformation(
-                    base_unit, "[carbon]", _get_transform_func(unit_reg_unit, conv_val)
-                )
-                tc.add_transformation(
-                    "[carbon]",
-                    base_unit,
-                    _get_transform_func(unit_reg_unit, conv_val, forward=False),
-                )
-                tc.add_transformation(
-                    "[mass] * {} / [time]".format(base_unit),
-                    "[mass] * [carbon] / [time]",
-                    _get_transform_func(unit_reg_unit, conv_val),
-                )
-                tc.add_transformation(
-                    "[mass] * [carbon] / [time]",
-                    "[mass] * {} / [time]".format(base_unit),
-                    _get_transform_func(unit_reg_unit, conv_val, forward=False),
-                )
-                tc.add_transformation(
-                    "[mass] * {}".format(base_unit),
-                    "[mass] * [carbon]",
-                    _get_transform_func(unit_reg_unit, conv_val),
-                )
-                tc.add_transformation(
-                    "[mass] * [carbon]",
-                    "[mass] * {}".format(base_unit),
-                    _get_transform_func(unit_reg_unit, conv_val, forward=False),
-                )
-                tc.add_transformation(
-                    "{} / [time]".format(base_unit),
-                    "[carbon] / [time]",
-                    _get_transform_func(unit_reg_unit, conv_val),
-                )
-                tc.add_transformation(
-                    "[carbon] / [time]",
-                    "{} / [time]".format(base_unit),
-                    _get_transform_func(unit_reg_unit, conv_val, forward=False),
+            )
+            if base_unit == "[carbon]":
+                # conversions to and from carbon itself are the identity
+                continue
+
+            # parse the dimensionalities here as the same ones are used in every
+            # metric context and pint would otherwise parse them for each transformation
+            dimensionalities = [
+                (
+                    to_units_container(dimensionality.format(base_unit)),
+                    to_units_container(dimensionality.format("[carbon]")),
                 )
+                for dimensionality in _METRIC_CONVERSION_DIMENSIONALITIES
+            ]
+            label_info[label] = (
+                label_base.magnitude,
+                dimensionalities,
+                getattr(self, base_unit.replace("[", "").replace("]", "")),
+            )
+
+        for i, col in enumerate(metrics):
+            tc = pint.Context(col)
+            for label, values in metric_conversions:
+                if label not in label_info:
+                    continue
+
+                label_magnitude, dimensionalities, unit_reg_unit = label_info[label]
+                conv_val = values[i] * co2_magnitude / label_magnitude
+                forward = _get_transform_func(unit_reg_unit, conv_val)
+                backward = _get_transform_func(unit_reg_unit, conv_val, forward=False)
+                for species_dimensionality, carbon_dimensionality in dimensionalities:
+                    tc.add_transformation(
+                        species_dimensionality, carbon_dimensionality, forward
+                    )
+                    tc.add_transformation(
+                        carbon_dimensionality, species_dimensionality, backward
+                    )
 
             self.add_context(tc)
 
@@ -460,11 +619,163 @@ The unit registry contains all of the recognised units.
 _unit_registry.add_standards()
 
 
+@functools.lru_cache(maxsize=512)
+def _get_unit(unit: str) -> Any:
+    """
+    Get a unit from the unit registry.
+
+    Pint parses the unit string on every call so parsed units are cached.
+
+    Parameters
+    ----------
+    unit
+        Unit to parse
+
+    Returns
+    -------
+    Any
+        Parsed Pint unit
+
+    Raises
+    ------
+    pint.errors.UndefinedUnitError
+        Unit undefined.
+    """
+    return _unit_registry.Unit(unit)
+
+
+def _is_multiplicative(unit: Any) -> bool:
+    """
+    Check whether a unit converts without an offset.
+
+    Only units with an offset in their definition (e.g. ``degC``, but not ``K`` or
+    ``delta_degC``) are not multiplicative.
+
+    Parameters
+    ----------
+    unit
+        Parsed Pint unit
+
+    Returns
+    -------
+    bool
+        ``True`` if all components of the unit are multiplicative
+    """
+    return all(
+        _unit_registry._is_multiplicative(name)  # pylint: disable=protected-access
+        for name in unit._units  # pylint: disable=protected-access
+    )
+
+
+def _get_scaling_and_offset(
+    source: str, target: str, context: Optional[str]
+) -> Tuple[float, float]:
+    """
+    Get the scaling and offset for converting between two units.
+
+    Parameters
+    ----------
+    source
+        Unit to convert **from**
+    target
+        Unit to convert **to**
+    context
+        Context to use for the conversion
+
+    Returns
+    -------
+    Tuple[float, float]
+        Scaling and offset of the conversion
+
+    Raises
+    ------
+    pint.errors.DimensionalityError
+        Units cannot be converted into each other.
+    pint.errors.UndefinedUnitError
+        Unit undefined.
+    """
+    source_unit = _get_unit(source)
+    if source == target:
+        # no need to ask Pint, the unit is still parsed above so undefined units raise
+        # (only exact matches are safe, e.g. "m s" and "ms" differ only by whitespace)
+        return 1.0, 0.0
+
+    target_unit = _get_unit(target)
+
+    s1 = _unit_registry.Quantity(1, source_unit)
+    if _is_multiplicative(source_unit) and _is_multiplicative(target_unit):
+        # no offset so a single conversion gives the scaling
+        if context is None:
+            t1 = s1.to(target_unit)
+        else:
+            with _unit_registry.context(context):
+                t1 = s1.to(target_unit)
+
+        return float(t1.m), 0.0
+
+    s2 = _unit_registry.Quantity(-1, source_unit)
+
+    if context is None:
+        t1 = s1.to(target_unit)
+        t2 = s2.to(target_unit)
+    else:
+        with _unit_registry.context(context):
+            t1 = s1.to(target_unit)
+            t2 = s2.to(target_unit)
+
+    scaling = float(t2.m - t1.m) / float(s2.m - s1.m)
+    offset = t1.m - scaling * s1.m
+
+    return scaling, offset
+
+
+_get_scaling_and_offset_cached = functools.lru_cache(maxsize=1024)(
+    _get_scaling_and_offset
+)
+"""
+Cached version of :func:`_get_scaling_and_offset`
+
+Only valid if no contexts are enabled on the unit registry outside of the conversion
+as these would change the result without changing the arguments.
+"""
+
+
+def _unchanged(
+    v: Union[float, np.ndarray], out: Optional[np.ndarray] = None
+) -> Union[float, np.ndarray]:
+    """
+    Return values for a conversion which does not change them.
+
+    Only scalars are returned as they are, anything else is still copied (into
+    :obj:`out` if given) so that, as for any other conversion, the result never shares
+    memory with the input.
+    """
+    if out is not None:
+        np.copyto(out, v)
+        return out
+    if np.isscalar(v):
+        return v
+    if isinstance(v, np.ndarray):
+        return np.array(v, dtype=np.result_type(v, 1.0))
+
+    # e.g. pandas objects, go through the arithmetic like any other conversion
+    return v * 1.0
+
+
 class UnitConverter:
     """
     Converts numbers between two units.
     """
 
+    __slots__ = (
+        "_source",
+        "_target",
+        "_offset",
+        "_scaling",
+        "_is_identity",
+        "_has_offset",
+    )
+
     _source: str
     """Source unit"""
 
@@ -477,6 +788,12 @@ class UnitConverter:
     _scaling: float
     """Scaling factor between units"""
 
+    _is_identity: bool
+    """Whether the conversion leaves values unchanged"""
+
+    _has_offset: bool
+    """Whether the conversion has an offset (otherwise it is a pure scaling)"""
+
     def __init__(self, source: str, target: str, context: Optional[str] = None):
         """
         Initialize.
@@ -502,31 +819,30 @@ class UnitConverter:
         self._source = source
         self._target = target
 
-        source_unit = _unit_registry.Unit(source)
-        target_unit = _unit_registry.Unit(target)
-
-        s1 = _unit_registry.Quantity(1, source_unit)
-        s2 = _unit_registry.Quantity(-1, source_unit)
+        source = _GAS_NAME_HYPHEN_RE.sub(r"\1", source)
+        target = _GAS_NAME_HYPHEN_RE.sub(r"\1", target)
 
-        if context is None:
-            t1 = s1.to(target_unit)
-            t2 = s2.to(target_unit)
+        # contexts which were enabled by the caller are not part of the cache key
+        if _unit_registry._active_ctx:  # pylint: disable=protected-access
+            get_scaling_and_offset = _get_scaling_and_offset
         else:
-            with _unit_registry.context(context):
-                t1 = s1.to(target_unit)
-                t2 = s2.to(target_unit)
+            get_scaling_and_offset = _get_scaling_and_offset_cached
+        self._scaling, self._offset = get_scaling_and_offset(source, target, context)
 
-        if np.isnan(t1) or np.isnan(t2):
+        # plain floats so avoid going through numpy
+        if math.isnan(self._scaling) or math.isnan(self._offset):
             warn_msg = (
                 "No conversion from {} to {} available, nan will be returned "
-                "upon conversion".format(source, target)
+                "upon conversion".format(self._source, self._target)
             )
             warnings.warn(warn_msg)
 
-        self._scaling = float(t2.m - t1.m) / float(s2.m - s1.m)
-        self._offset = t1.m - self._scaling * s1.m
+        self._is_identity = self._scaling == 1.0 and self._offset == 0.0
+        self._has_offset = self._offset != 0.0
 
-    def convert_from(self, v: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    def convert_from(
+        self, v: Union[float, np.ndarray], out: Optional[np.ndarray] = None
+    ) -> Union[float, np.ndarray]:
         """
         Convert value **from** source unit to target unit.
 
@@ -534,15 +850,30 @@ class UnitConverter:
         ----------
         value
             Value in source unit
+        out
+            Array to write the result into (can be :obj:`v` itself). If ``None``, a
+            new array is allocated for array input.
 
         Returns
         -------
         Union[float, np.ndarray]
             Value in target unit
         """
+        if self._is_identity:
+            return _unchanged(v, out)
+
+        if out is not None or isinstance(v, np.ndarray):
+            res = np.multiply(v, self._scaling, out=out)
+            if self._has_offset:
+                # add the offset in place to avoid allocating a second temporary array
+                res += self._offset
+            return res
+
         return self._offset + v * self._scaling
 
-    def convert_to(self, v: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    def convert_to(
+        self, v: Union[float, np.ndarray], out: Optional[np.ndarray] = None
+    ) -> Union[float, np.ndarray]:
         """
         Convert value from target unit **to** source unit.
 
@@ -550,12 +881,26 @@ class UnitConverter:
         ----------
         value
             Value in target unit
+        out
+            Array to write the result into (can be :obj:`v` itself). If ``None``, a
+            new array is allocated for array input.
 
         Returns
         -------
         Union[float, np.ndarray]
             Value in source unit
         """
+        if self._is_identity:
+            return _unchanged(v, out)
+
+        if out is not None or isinstance(v, np.ndarray):
+            if not self._has_offset:
+                return np.divide(v, self._scaling, out=out)
+            # divide in place to avoid allocating a second temporary array
+            res = np.subtract(v, self._offset, out=out)
+            res /= self._scaling
+            return res
+
         return (v - self._offset) / self._scaling
 
     @property
@@ -585,3 +930,135 @@ class UnitConverter:
         Target unit
         """
         return self._target
+
+
+class BatchUnitConverter:
+    """
+    Converts many series of numbers at once, each between its own pair of units.
+
+    The scaling factors and offsets of all series are kept in contiguous arrays so that
+    a whole stack of series is converted with a single vectorised operation rather than
+    one :class:`UnitConverter` call per series.
+    """
+
+    _sources: Tuple[str, ...]
+    """Source units"""
+
+    _targets: Tuple[str, ...]
+    """Target units"""
+
+    _offset: np.ndarray
+    """Offset for each series (e.g. for temperature units)"""
+
+    _scaling: np.ndarray
+    """Scaling factor for each series"""
+
+    def __init__(
+        self,
+        sources: Sequence[str],
+        targets: Sequence[str],
+        context: Optional[str] = None,
+    ):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        sources
+            Unit to convert **from** for each series
+        targets
+            Unit to convert **to** for each series
+        context
+            Context to use for the conversions, see :class:`UnitConverter`
+
+        Raises
+        ------
+        ValueError
+            :obj:`sources` and :obj:`targets` are not of the same length
+        pint.errors.DimensionalityError
+            Units cannot be converted into each other.
+        pint.errors.UndefinedUnitError
+            Unit undefined.
+        """
+        if len(sources) != len(targets):
+            raise ValueError("sources and targets must be of the same length")
+
+        self._sources = tuple(sources)
+        self._targets = tuple(targets)
+
+        # pylint: disable=protected-access
+        pairs = list(zip(self._sources, self._targets))
+        # only resolve each distinct unit pair once
+        converters = {
+            pair: UnitConverter(pair[0], pair[1], context=context)
+            for pair in set(pairs)
+        }
+        self._scaling = np.array([converters[p]._scaling for p in pairs], dtype=float)
+        self._offset = np.array([converters[p]._offset for p in pairs], dtype=float)
+
+    @staticmethod
+    def _per_series(a: np.ndarray, ndim: int) -> np.ndarray:
+        """
+        Reshape per series values so they broadcast along the first axis.
+        """
+        return a.reshape((-1,) + (1,) * (ndim - 1))
+
+    def convert_from(
+        self, v: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Convert values **from** source units to target units.
+
+        Parameters
+        ----------
+        v
+            Values in source units, one series per row (i.e. along the first axis)
+        out
+            Array to write the result into (can be :obj:`v` itself). If ``None``, a
+            new array is allocated.
+
+        Returns
+        -------
+        np.ndarray
+            Values in target units
+        """
+        v = np.asarray(v)
+        res = np.multiply(v, self._per_series(self._scaling, v.ndim), out=out)
+        res += self._per_series(self._offset, v.ndim)
+        return res
+
+    def convert_to(self, v: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Convert values from target units **to** source units.
+
+        Parameters
+        ----------
+        v
+            Values in target units, one series per row (i.e. along the first axis)
+        out
+            Array to write the result into (can be :obj:`v` itself). If ``None``, a
+            new array is allocated.
+
+        Returns
+        -------
+        np.ndarray
+            Values in source units
+        """
+        v = np.asarray(v)
+        res = np.subtract(v, self._per_series(self._offset, v.ndim), out=out)
+        res /= self._per_series(self._scaling, v.ndim)
+        return res
+
+    @property
+    def sources(self) -> Tuple[str, ...]:
+        """
+        Source units
+        """
+        return self._sources
+
+    @property
+    def targets(self) -> Tuple[str, ...]:
+        """
+        Target units
+        """
+        return self._targets
@@ -4,7 +4,7 @@ data. It provides a simple interface for reading/writing, subsetting and visuali
 model data. ScmDataFrames are able to hold multiple model runs which aids in analysis of
 ensembles of model runs.
 """
-from typing import Dict, List, Tuple, Union, cast
+from typing import Dict, List, Optional, Tuple, Union, cast
 
 import numpy as np
 
@@ -74,11 +74,8 @@ def convert_openscm_to_scmdataframe(  # pylint: disable=too-many-locals
         :class:`ScmDataFrame` containing the data from :obj:`parameterset`
     """
     time_points = np.asarray(time_points, dtype="datetime64[s]")
-    time_points_average = np.copy(time_points)
-    delta_t = time_points_average[-1] - time_points_average[-2]
-    time_points_average = np.concatenate(
-        [time_points_average, [time_points_average[-1] + delta_t]]
-    )
+    # only built if an average timeseries is actually extracted
+    time_points_average: Optional[np.ndarray] = None
 
     def walk_parameters(
         para: _Parameter, past: Tuple[str, ...] = ()
@@ -121,9 +118,12 @@ def convert_openscm_to_scmdataframe(  # pylint: disable=too-many-locals
             root_params.update(walk_parameters(value))
 
     for (param_name, region), p_info in root_params.items():
+        # ``cast`` is still a function call at runtime so only do it once per parameter
+        para_type = cast(ParameterType, p_info.parameter_type)
+        unit = cast(str, p_info.unit)
         # All meta values are stored as generic value (AKA no units)
         # TODO: fix this
-        if p_info.parameter_type == ParameterType.GENERIC:
+        if para_type == ParameterType.GENERIC:
             if region != ("World",):
                 raise ValueError(
                     "Only generic types with Region==World can be extracted"
@@ -131,35 +131,32 @@ def convert_openscm_to_scmdataframe(  # pylint: disable=too-many-locals
             metadata[parameter_name_to_scm(param_name)] = [
                 parameterset.generic(param_name, region=region).value
             ]
-        elif p_info.parameter_type == ParameterType.SCALAR:
+        elif para_type == ParameterType.SCALAR:
             if region != ("World",):
                 raise ValueError(
                     "Only scalar types with Region==World can be extracted"
                 )
-            meta_key = "{} ({})".format(parameter_name_to_scm(param_name), p_info.unit)
-            meta_value = parameterset.scalar(
-                param_name, unit=cast(str, p_info.unit)
-            ).value
+            meta_key = "{} ({})".format(parameter_name_to_scm(param_name), unit)
+            meta_value = parameterset.scalar(param_name, unit=unit).value
             metadata[meta_key] = [meta_value]
         else:
-            para_type = cast(ParameterType, p_info.parameter_type)
-            tp = (
-                time_points
-                if para_type == ParameterType.POINT_TIMESERIES
-                else time_points_average
-            )
+            if para_type == ParameterType.POINT_TIMESERIES:
+                tp = time_points
+            else:
+                if time_points_average is None:
+                    delta_t = time_points[-1] - time_points[-2]
+                    time_points_average = np.concatenate(
+                        [time_points, [time_points[-1] + delta_t]]
+                    )
+                tp = time_points_average
 
             ts = parameterset.timeseries(
-                param_name,
-                cast(str, p_info.unit),
-                tp,
-                region=region,
-                timeseries_type=para_type,
+                param_name, unit, tp, region=region, timeseries_type=para_type
             )
             data.append(ts.values)
             metadata["variable"].append(parameter_name_to_scm(param_name))
             metadata["region"].append(parameter_name_to_scm(region))
-            metadata["unit"].append(cast(str, p_info.unit))
+            metadata["unit"].append(unit)
             metadata["parameter_type"].append(
                 ParameterType.timeseries_type_to_string(para_type)
             )
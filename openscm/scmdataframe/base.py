@@ -24,7 +24,7 @@ from ..core.time import (
     TimePoints,
     TimeseriesConverter,
 )
-from ..core.units import UnitConverter
+from ..core.units import BatchUnitConverter
 from .filters import (
     datetime_match,
     day_match,
@@ -405,6 +405,28 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         """
         return copy.deepcopy(self)
 
+    def _copy_without_data(self) -> ScmDataFrameBase:
+        """
+        Return a :func:`copy.deepcopy` of self with empty data.
+
+        Use this instead of :meth:`copy` if the data is replaced anyway so that it is not
+        copied needlessly. The data of the copy keeps the columns of ``self`` but has no
+        rows.
+
+        Returns
+        -------
+        :obj:`ScmDataFrameBase`
+            :func:`copy.deepcopy` of ``self`` with empty data
+        """
+        res = copy.copy(self)
+        memo: Dict[int, Any] = {}
+        for name, value in vars(self).items():
+            if name != "_data":
+                setattr(res, name, copy.deepcopy(value, memo))
+        res._data = self._data.iloc[:0].copy()  # pylint: disable=protected-access
+
+        return res
+
     def _sort_meta_cols(self):
         # First columns are from REQUIRED_COLS and the remainder of the columns are alphabetically sorted
         self._meta = self._meta[
@@ -496,6 +518,12 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         if parameterset is None:
             parameterset = ParameterSet()
 
+        # parameters copy the time points they are given so the same arrays can be
+        # passed for every timeseries, the average time points are only built if an
+        # average timeseries is actually present
+        time_points = self.time_points
+        time_points_average: Optional[np.ndarray] = None
+
         for i in self._data:
             vals = self._data[i]
             metadata = self._meta.loc[i]
@@ -509,15 +537,20 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
             except KeyError:
                 timeseries_type = guess_parameter_type(variable, unit)
 
-            time_points = self.time_points
             if timeseries_type == ParameterType.AVERAGE_TIMESERIES:
-                delta_t = time_points[-1] - time_points[-2]
-                time_points = np.concatenate((time_points, [time_points[-1] + delta_t]))
+                if time_points_average is None:
+                    delta_t = time_points[-1] - time_points[-2]
+                    time_points_average = np.concatenate(
+                        (time_points, [time_points[-1] + delta_t])
+                    )
+                parameter_time_points = time_points_average
+            else:
+                parameter_time_points = time_points
 
             parameterset.timeseries(
                 variable,
                 unit,
-                time_points,
+                parameter_time_points,
                 region=region,
                 timeseries_type=timeseries_type,
             ).values = vals.values
@@ -713,23 +746,26 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         """
         regexp = filters.pop("regexp", False)
         keep_ts = np.array([True] * len(self._data))
-        keep_meta = np.array([True] * len(self.meta))
+        # pattern_match copies the columns it is given so there is no need to copy
+        # the whole metadata table via ``self.meta`` for every filter
+        meta = self._meta
+        keep_meta = np.array([True] * len(meta))
 
         # filter by columns and list of values
         for col, values in filters.items():
             if col == "variable":
                 level = filters["level"] if "level" in filters else None
                 keep_meta &= pattern_match(
-                    self.meta[col],
+                    meta[col],
                     values,
                     level,
                     regexp,
                     has_nan=has_nan,
                     separator=self.data_hierarchy_separator,
                 ).values
-            elif col in self.meta.columns:
+            elif col in meta.columns:
                 keep_meta &= pattern_match(
-                    self.meta[col],
+                    meta[col],
                     values,
                     regexp=regexp,
                     has_nan=has_nan,
@@ -753,7 +789,7 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
             elif col == "level":
                 if "variable" not in filters.keys():
                     keep_meta &= pattern_match(
-                        self.meta["variable"],
+                        meta["variable"],
                         "*",
                         values,
                         regexp=regexp,
@@ -979,31 +1015,33 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
             target_times.astype(object), dtype="object", name="time"
         )
 
-        res = self.copy()
+        # the data is replaced below so skip copying it
+        res = self._copy_without_data()
 
         # Add in a parameter_type column if it doesn't exist
         if "parameter_type" not in res._meta:
             res._meta["parameter_type"] = None
             res._sort_meta_cols()
 
-        def guess(r):
-            if r.parameter_type is None:
-                warnings.warn(
-                    "`parameter_type` metadata not available. Guessing parameter types where unavailable."
-                )
-                parameter_type = guess_parameter_type(r.variable, r.unit)
-                r.parameter_type = (
+        missing_parameter_type = res._meta["parameter_type"].isnull()
+        if missing_parameter_type.any():
+            warnings.warn(
+                "`parameter_type` metadata not available. Guessing parameter types where unavailable."
+            )
+            res._meta.loc[missing_parameter_type, "parameter_type"] = [
+                (
                     "average"
-                    if parameter_type == ParameterType.AVERAGE_TIMESERIES
+                    if guess_parameter_type(v, u) == ParameterType.AVERAGE_TIMESERIES
                     else "point"
                 )
-            return r
-
-        res._meta.apply(guess, axis=1)
+                for v, u in res._meta.loc[
+                    missing_parameter_type, ["variable", "unit"]
+                ].itertuples(index=False)
+            ]
 
         # Resize dataframe to new index length
-        old_data = res._data
-        res._data = pd.DataFrame(index=timeseries_index, columns=res._data.columns)
+        old_data = self._data
+        res._data = pd.DataFrame(index=timeseries_index, columns=old_data.columns)
 
         for parameter_type, grp in res._meta.groupby("parameter_type"):
             p_type = ParameterType.from_timeseries_type(parameter_type)
@@ -1223,13 +1261,13 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         """
         Convert the units of a selection of timeseries.
 
-        Uses :class:`openscm.units.UnitConverter` to perform the conversion.
+        Uses :class:`openscm.core.units.BatchUnitConverter` to perform the conversion.
 
         Parameters
         ----------
         unit
             Unit to convert to. This must be recognised by
-            :class:`~openscm.units.UnitConverter`.
+            :class:`~openscm.core.units.UnitConverter`.
 
         context
             Context to use for the conversion i.e. which metric to apply when performing
@@ -1258,14 +1296,21 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
             ret._meta["unit_context"] = None
             ret._sort_meta_cols()
 
-        to_convert = ret.filter(**kwargs)
-        for orig_unit, grp in to_convert._meta.groupby("unit"):  # type: ignore
-            uc = UnitConverter(orig_unit, unit, context=context)
-            ret._data[grp.index] = ret._data[grp.index].apply(uc.convert_from)
-            # TODO: check if unit_context has changed
-            ret._meta.loc[grp.index] = ret._meta.loc[grp.index].assign(
-                unit=unit, unit_context=context
-            )
+        to_convert = ret.filter(**kwargs)._meta  # type: ignore
+        # timeseries without a unit cannot be converted so are left as they are
+        to_convert = to_convert[to_convert["unit"].notnull()]
+        uc = BatchUnitConverter(
+            to_convert["unit"].tolist(), [unit] * len(to_convert), context=context
+        )
+        # selecting the columns copies the data so it can be converted in place, the
+        # converter expects one timeseries per row hence the transposes
+        vals = ret._data[to_convert.index].values
+        uc.convert_from(vals.T, out=vals.T)
+        ret._data[to_convert.index] = vals
+        # TODO: check if unit_context has changed
+        ret._meta.loc[to_convert.index] = ret._meta.loc[to_convert.index].assign(
+            unit=unit, unit_context=context
+        )
 
         if not inplace:
             return ret
@@ -1303,7 +1348,6 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         )
 
         res = ts.sub(ref_period_mean, axis="rows")
-        res.reset_index(inplace=True)
 
         if append_str is None:
             append_str = ";".join(
@@ -1311,9 +1355,13 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
             )
             append_str = "(ref. period {})".format(append_str)
 
-        res["variable"] = res["variable"].apply(lambda x: "{} {}".format(x, append_str))
+        # only the (unique) level values need renaming, the codes stay untouched
+        variables = res.index.levels[res.index.names.index("variable")]
+        res.index = res.index.set_levels(
+            variables.astype(str) + " {}".format(append_str), level="variable"
+        )
 
-        return res.set_index(ts.index.names)
+        return res
 
     def append(
         self,
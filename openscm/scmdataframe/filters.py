@@ -95,11 +95,10 @@ def find_depth(
         raise ValueError("Unknown level type: {}".format(level))
 
     # determine depth
-    pipe = re.compile(re.escape(separator))
     regexp = str(s).replace("*", "")
 
     def apply_test(val):
-        return test(len(pipe.findall(val.replace(regexp, ""))))
+        return test(val.replace(regexp, "").count(separator))
 
     return np.array([b for b in [apply_test(m) for m in meta_col]])
 
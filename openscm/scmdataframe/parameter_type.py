@@ -2,6 +2,7 @@
 Functionality for guessing the parameter types from variable names and unit.
 """
 import re
+from functools import lru_cache
 from typing import Optional
 
 from ..core.parameters import ParameterType
@@ -23,6 +24,7 @@ parameter_matches = [
 ]
 
 
+@lru_cache(maxsize=1024)
 def guess_parameter_type(variable_name: str, unit: Optional[str]) -> ParameterType:
     """
     Attempt to guess the parameter of timeseries from a variable name and unit.
@@ -38,6 +40,9 @@ def guess_parameter_type(variable_name: str, unit: Optional[str]) -> ParameterTy
     If the units are not available, we will guess based on the :obj:`variable_name`. If
     we don't recognise the name, :attr:`ParameterType.POINT_TIMESERIES` is returned.
 
+    Guesses are cached per (:obj:`variable_name`, :obj:`unit`) pair as parsing the unit
+    is comparatively expensive and the same pairs are typically guessed repeatedly.
+
     Parameters
     ----------
     variable_name
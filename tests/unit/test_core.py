@@ -1,3 +1,4 @@
+import pickle
 import re
 import warnings
 
@@ -287,6 +288,15 @@ def test_scalar_parameter_view(model):
     assert cs_writable.value == 45
 
 
+def test_scalar_parameter_view_pickle():
+    parameterset = ParameterSet()
+    parameterset.scalar("Climate Sensitivity", "degF").value = 68
+    cs = parameterset.scalar("Climate Sensitivity", "degC")
+
+    cs_unpickled = pickle.loads(pickle.dumps(cs))
+    np.testing.assert_allclose(cs_unpickled.value, 20)
+
+
 def test_scalar_parameter_view_aggregation(model):
     ta_1 = 0.6
     ta_2 = 0.3
@@ -1342,6 +1342,28 @@ def test_interpolate(combo_df):
     npt.assert_array_almost_equal(res.values.squeeze(), combo.target_values)
 
 
+def test_interpolate_keeps_original_data(test_scm_df):
+    data = test_scm_df._data
+    exp = data.copy()
+
+    test_scm_df.interpolate([datetime.datetime(y, 1, 1) for y in range(2005, 2011)])
+
+    assert test_scm_df._data is data
+    pd.testing.assert_frame_equal(test_scm_df._data, exp)
+
+
+def test_copy_without_data(test_scm_df):
+    data = test_scm_df._data
+    res = test_scm_df._copy_without_data()
+
+    assert test_scm_df._data is data
+    assert res._data.empty
+    pd.testing.assert_index_equal(res._data.columns, data.columns)
+    assert res._meta is not test_scm_df._meta
+    pd.testing.assert_frame_equal(res._meta, test_scm_df._meta)
+    assert res._time_points is not test_scm_df._time_points
+
+
 def test_interpolate_missing_param_type(combo_df, doesnt_warn):
     combo, df = combo_df
     df._meta.pop("parameter_type")
@@ -1367,6 +1389,16 @@ def test_interpolate_missing_param_type(combo_df, doesnt_warn):
         )
 
 
+def test_interpolate_missing_param_type_warns_once(test_processing_scm_df):
+    with pytest.warns(UserWarning) as record:
+        res = test_processing_scm_df.interpolate(
+            [datetime.datetime(y, 1, 1) for y in range(2005, 2016)]
+        )
+
+    assert len(record) == 1
+    assert (res["parameter_type"] == "average").all()
+
+
 def test_interpolate_parameter_type(combo_df):
     combo, df = combo_df
     df["parameter_type"] = combo.timeseries_type
@@ -1762,6 +1794,17 @@ def test_convert_unit_inplace(test_scm_df):
     )
 
 
+def test_convert_unit_missing_unit(test_scm_df):
+    test_scm_df["unit"] = ["EJ/yr", np.nan, "EJ/yr"]
+    obs = test_scm_df.convert_unit("PJ/yr")
+
+    assert obs["unit"].tolist()[::2] == ["PJ/yr", "PJ/yr"]
+    assert pd.isnull(obs["unit"].iloc[1])
+    npt.assert_array_almost_equal(
+        obs.filter(year=2005).values.squeeze(), [1000.0, 0.5, 2000.0]
+    )
+
+
 def test_convert_unit_context(test_scm_df):
     test_scm_df = test_scm_df.filter(
         variable="Primary Energy"
@@ -1,6 +1,12 @@
+import numpy as np
 import pytest
 
-from openscm.core.time import ExtrapolationType, InterpolationType
+from openscm.core.time import (
+    ExtrapolationType,
+    InterpolationType,
+    TimePoints,
+    create_time_points,
+)
 
 
 @pytest.mark.parametrize(
@@ -20,3 +26,65 @@ def test_init_extrapolation(input, output):
 def test_init_interpolation(input, output):
     res = InterpolationType.from_interpolation_type(input)
     assert res == output
+
+
+def test_time_points_years():
+    tp = TimePoints(
+        np.array(
+            ["1700-06-01", "1969-12-31T23:00:00", "2000-01-01", "3000-07-15"],
+            dtype="datetime64[s]",
+        )
+    )
+    np.testing.assert_array_equal(tp.years(), [1700, 1969, 2000, 3000])
+
+
+def test_time_points_datetime_components():
+    values = np.array(
+        [
+            "1700-06-01T13:00:00",
+            "1969-12-31T23:59:59",
+            "2000-02-29T00:00:00",
+            "2019-07-15T07:30:00",
+            "3000-12-01T18:00:00",
+        ],
+        dtype="datetime64[s]",
+    )
+    tp = TimePoints(values)
+    dts = values.astype(object)
+
+    np.testing.assert_array_equal(tp.months(), [d.month for d in dts])
+    np.testing.assert_array_equal(tp.days(), [d.day for d in dts])
+    np.testing.assert_array_equal(tp.hours(), [d.hour for d in dts])
+    np.testing.assert_array_equal(tp.weekdays(), [d.weekday() for d in dts])
+
+
+@pytest.mark.parametrize(
+    "start_time,period_length,timeseries_type,expected",
+    [
+        (
+            np.datetime64("2000", "Y"),
+            np.timedelta64(1, "Y"),
+            "average",
+            ["2000-01-01", "2001-01-01", "2002-01-01", "2003-01-01"],
+        ),
+        (
+            np.datetime64("2000-01", "M"),
+            np.timedelta64(1, "M"),
+            "point",
+            ["2000-01-01", "2000-02-01", "2000-03-01"],
+        ),
+        (
+            np.datetime64("2000-01-01"),
+            np.timedelta64(10, "D"),
+            "point",
+            ["2000-01-01", "2000-01-11", "2000-01-21"],
+        ),
+    ],
+)
+def test_create_time_points(start_time, period_length, timeseries_type, expected):
+    # calendar periods step by whole years or months rather than by their average
+    # length in seconds
+    np.testing.assert_array_equal(
+        create_time_points(start_time, period_length, 3, timeseries_type),
+        np.array(expected, dtype="datetime64[s]"),
+    )
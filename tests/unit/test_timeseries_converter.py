@@ -2,8 +2,14 @@ import re
 
 import numpy as np
 import pytest
+import scipy.integrate as integrate
+import scipy.interpolate as interpolate
 
-from openscm.core.time import ExtrapolationType, TimeseriesConverter
+from openscm.core.time import (
+    ExtrapolationType,
+    TimeseriesConverter,
+    _calc_interval_averages,
+)
 from openscm.errors import InsufficientDataError
 
 
@@ -42,3 +48,24 @@ def test_none_extrapolation_error(combo):
     )
     with pytest.raises(InsufficientDataError, match=error_msg):
         timeseriesconverter._convert(combo.source_values, combo.source, target)
+
+
+@pytest.mark.parametrize("fill_value", ["extrapolate", (-1, 3)])
+def test_interval_averages_piecewise_linear(fill_value):
+    knots = np.array([0, 1, 2.5, 4, 7, 10])
+    continuous_representation = interpolate.interp1d(
+        knots, [0, 2, 1, 1.5, -1, 3], bounds_error=False, fill_value=fill_value
+    )
+    target_intervals = np.array([-2, 0, 3, 4, 9, 12])
+
+    expected = [
+        integrate.quad(continuous_representation, l, u, points=knots, limit=100)[0]
+        / (u - l)
+        for l, u in zip(target_intervals[:-1], target_intervals[1:])
+    ]
+    np.testing.assert_allclose(
+        _calc_interval_averages(
+            continuous_representation, target_intervals, knots=knots
+        ),
+        expected,
+    )
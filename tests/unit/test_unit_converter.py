@@ -1,9 +1,18 @@
+import pickle
 import warnings
+from unittest import mock
 
 import numpy as np
+import pandas as pd
 import pytest
 
-from openscm.core.units import UnitConverter, _unit_registry
+from openscm.core.units import (
+    _GAS_NAME_HYPHEN_RE,
+    BatchUnitConverter,
+    UnitConverter,
+    _get_scaling_and_offset_cached,
+    _unit_registry,
+)
 from openscm.errors import DimensionalityError, UndefinedUnitError
 
 
@@ -21,6 +30,88 @@ def test_conversion_with_offset():
     np.testing.assert_allclose(uc.convert_to(1), -17.22222, rtol=1e-5)
 
 
+@pytest.mark.parametrize(
+    "source,target,scaling,offset",
+    [
+        ("K", "degC", 1, -273.15),
+        ("degC", "K", 1, 273.15),
+        ("delta_degC", "delta_degF", 1.8, 0),
+        ("degC / yr", "degF / yr", 1.8, 0),
+    ],
+)
+def test_conversion_offset_only_for_offset_units(source, target, scaling, offset):
+    uc = UnitConverter(source, target)
+    np.testing.assert_allclose(uc.convert_from(0), offset, atol=1e-10)
+    np.testing.assert_allclose(uc.convert_from(1), scaling + offset)
+
+
+def test_conversion_with_offset_array():
+    uc = UnitConverter("degC", "degF")
+    v = np.array([1, 2])
+    np.testing.assert_allclose(uc.convert_from(v), [33.8, 35.6])
+    np.testing.assert_allclose(uc.convert_to(v), [-17.22222, -16.66667], rtol=1e-5)
+    np.testing.assert_array_equal(v, [1, 2])
+
+
+def test_conversion_out():
+    uc = UnitConverter("degC", "degF")
+    v = np.array([1.0, 2.0])
+    res = uc.convert_from(v, out=v)
+    assert res is v
+    np.testing.assert_allclose(v, [33.8, 35.6])
+    res = uc.convert_to(v, out=v)
+    assert res is v
+    np.testing.assert_allclose(v, [1, 2])
+
+
+def test_conversion_without_offset_array():
+    uc = UnitConverter("kg", "t")
+    v = np.array([1000, 2000])
+    res = uc.convert_from(v)
+    np.testing.assert_allclose(res, [1, 2])
+    np.testing.assert_array_equal(v, [1000, 2000])
+
+    out = np.empty(2)
+    res = uc.convert_to(np.array([1, 2]), out=out)
+    assert res is out
+    np.testing.assert_allclose(out, [1000, 2000])
+
+
+def test_conversion_identity():
+    uc = UnitConverter("kg CO2 / yr", "kg CO2 / yr")
+    assert uc.convert_from(2) == 2
+    assert uc.convert_to(2) == 2
+
+    v = np.array([1, 2])
+    res = uc.convert_from(v)
+    assert res is not v
+    assert res.dtype == float
+    np.testing.assert_array_equal(res, v)
+
+    s = pd.Series([1, 2])
+    res = uc.convert_to(s)
+    assert res is not s
+    res[0] = 3
+    assert s[0] == 1
+
+    with pytest.raises(UndefinedUnitError):
+        UnitConverter("UNKOWN", "UNKOWN")
+
+
+def test_conversion_hyphenated_gas_name():
+    uc = UnitConverter("kt HFC-134a / yr", "t HFC134a / yr^1")
+    assert uc.source == "kt HFC-134a / yr"
+    assert uc.convert_from(1) == 1000
+
+    uc = UnitConverter("kg CO2 yr^-1", "t CO2 / yr")
+    assert uc.convert_from(1000) == 1
+
+
+@pytest.mark.parametrize("unit", ["W m-2", "t CO2 yr-1", "kg m-2 s-1"])
+def test_conversion_hyphen_not_in_gas_name(unit):
+    assert _GAS_NAME_HYPHEN_RE.sub(r"\1", unit) == unit
+
+
 def test_conversion_unknown_unit():
     with pytest.raises(UndefinedUnitError):
         UnitConverter("UNKOWN", "degF")
@@ -57,6 +148,117 @@ def test_metric_conversion_unit_converter_nan():
     assert str(recorded_warnings[0].message) == expected_warning
 
 
+def test_metric_conversion_unit_converter_nan_hyphenated_gas():
+    expected_warning = (
+        "No conversion from HCFC-21 to CO2 available, nan will be returned "
+        "upon conversion"
+    )
+    with _unit_registry.context("AR4GWP100"):
+        with warnings.catch_warnings(record=True) as recorded_warnings:
+            UnitConverter("HCFC-21", "CO2")
+
+    assert len(recorded_warnings) == 1
+    assert str(recorded_warnings[0].message) == expected_warning
+
+
+@pytest.mark.parametrize(
+    "source,target,context",
+    [
+        ("kg SF5CF3 / yr", "kg CO2 / yr", "AR4GWP100"),
+        ("degC", "degF", None),
+        ("kg", "kg", None),
+    ],
+)
+def test_conversion_does_not_use_pint(source, target, context):
+    uc = UnitConverter(source, target, context=context)
+    buc = BatchUnitConverter([source], [target], context=context)
+    expected = uc.convert_from(np.array([1.0, 2.0]))
+
+    # everything needed is resolved at initialisation, any access to the unit registry
+    # during conversion would fail
+    with mock.patch("openscm.core.units._unit_registry", None):
+        np.testing.assert_allclose(uc.convert_from(np.array([1.0, 2.0])), expected)
+        np.testing.assert_allclose(uc.convert_to(expected), [1, 2])
+        np.testing.assert_allclose(uc.convert_from(1.0), expected[0])
+        np.testing.assert_allclose(buc.convert_from(np.array([[1.0, 2.0]])), [expected])
+        np.testing.assert_allclose(buc.convert_to(np.array([expected])), [[1, 2]])
+
+
+def test_conversion_cached():
+    UnitConverter("kg", "Mt")
+    hits = _get_scaling_and_offset_cached.cache_info().hits
+    uc = UnitConverter("kg", "Mt")
+    assert _get_scaling_and_offset_cached.cache_info().hits == hits + 1
+    np.testing.assert_allclose(uc.convert_from(1e9), 1)
+
+
+def test_conversion_outer_context_not_cached():
+    with _unit_registry.context("AR4GWP100"):
+        uc = UnitConverter("kg SF5CF3 / yr", "kg CO2 / yr")
+    assert uc.convert_from(1) == 17700
+
+    with pytest.raises(DimensionalityError):
+        UnitConverter("kg SF5CF3 / yr", "kg CO2 / yr")
+
+
+@pytest.mark.parametrize(
+    "source,target,context",
+    [
+        ("kg SF5CF3 / yr", "kg CO2 / yr", "AR4GWP100"),
+        ("degC", "degF", None),
+        ("kg", "t", None),
+        ("kg", "kg", None),
+    ],
+)
+def test_pickle(source, target, context):
+    uc = UnitConverter(source, target, context=context)
+    uc_unpickled = pickle.loads(pickle.dumps(uc))
+
+    assert uc_unpickled.source == source
+    assert uc_unpickled.target == target
+    assert uc_unpickled.convert_from(2) == uc.convert_from(2)
+    assert uc_unpickled.convert_to(2) == uc.convert_to(2)
+
+
+def test_no_instance_dict():
+    uc = UnitConverter("kg", "t")
+    assert not hasattr(uc, "__dict__")
+    with pytest.raises(AttributeError):
+        uc.unknown = 1
+
+
 def test_properties():
     assert UnitConverter("CO2", "C").contexts
     assert UnitConverter("CO2", "C").unit_registry
+
+
+def test_batch_conversion():
+    sources = ["kg", "degC", "kg"]
+    targets = ["t", "degF", "g"]
+    buc = BatchUnitConverter(sources, targets)
+    assert buc.sources == tuple(sources)
+    assert buc.targets == tuple(targets)
+
+    v = np.array([[1000, 2000], [1, 2], [1, 2]])
+    expected = np.array(
+        [
+            UnitConverter(s, t).convert_from(row)
+            for s, t, row in zip(sources, targets, v)
+        ]
+    )
+    np.testing.assert_allclose(buc.convert_from(v), expected)
+    np.testing.assert_allclose(buc.convert_to(expected), v)
+    np.testing.assert_allclose(buc.convert_from(v[:, 0]), expected[:, 0])
+
+
+def test_batch_conversion_with_context():
+    buc = BatchUnitConverter(
+        ["kg SF5CF3 / yr", "kg CO2 / yr"], ["kg CO2 / yr"] * 2, context="AR4GWP100"
+    )
+    np.testing.assert_allclose(buc.convert_from(np.array([1, 1])), [17700, 1])
+
+
+def test_batch_conversion_length_mismatch():
+    error_msg = "sources and targets must be of the same length"
+    with pytest.raises(ValueError, match=error_msg):
+        BatchUnitConverter(["kg", "kg"], ["t"])
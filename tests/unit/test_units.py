@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
 
-from openscm.core.units import _unit_registry
+from openscm.core.units import ScmUnitRegistry, _unit_registry
 from openscm.errors import DimensionalityError
 
 
@@ -24,6 +26,54 @@ def test_nitrogen():
     np.testing.assert_allclose(N.to("N2ON").magnitude, 28 / 14)
 
 
+def test_nitrogen_not_newton():
+    assert _unit_registry("N").dimensionality == {"[nitrogen]": 1}
+    assert _unit_registry("kN").dimensionality == {"[nitrogen]": 1}
+
+
+def test_gases_defined_on_first_use():
+    unit_registry = ScmUnitRegistry()
+    unit_registry.add_standards()
+    assert "HFC134a" in unit_registry._pending_definitions
+    assert "tHFC134A" in unit_registry._pending_definitions
+
+    assert unit_registry("Mt HFC134A / yr").to("kt HFC134a / yr").magnitude == 1000
+    assert "HFC134a" not in unit_registry._pending_definitions
+    assert "tHFC134A" not in unit_registry._pending_definitions
+    assert "CO2" in unit_registry._pending_definitions
+
+
+def test_gases_defined_on_first_use_get_symbol():
+    unit_registry = ScmUnitRegistry()
+    unit_registry.add_standards()
+
+    assert unit_registry.get_symbol("CO2") == "CO2"
+    assert unit_registry.get_symbol("tN2O") == "tN2O"
+    assert unit_registry._is_multiplicative("CH4")
+
+
+def test_gases_defined_on_first_use_parse_unit_name():
+    unit_registry = ScmUnitRegistry()
+    unit_registry.add_standards()
+
+    assert list(unit_registry.parse_unit_name("MtCH4")) == [("mega", "tCH4", None)]
+    assert list(unit_registry.parse_unit_name("UNKNOWN")) == []
+
+
+def test_gases_defined_on_first_use_threads():
+    unit_registry = ScmUnitRegistry()
+    unit_registry.add_standards()
+
+    def convert(_):
+        return unit_registry("Mt CO2 / yr").to("kt C / yr").magnitude
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(convert, range(32)))
+
+    np.testing.assert_allclose(results, 1000 * 12 / 44)
+    assert "CO2" not in unit_registry._pending_definitions
+
+
 def test_nox():
     NOx = _unit_registry("NOx")
     with pytest.raises(DimensionalityError):